@@ -9,39 +9,135 @@ import os
 import sys
 import json
 import re
-from typing import Dict, List, Optional, Tuple
+import html
+import textwrap
+import time
+import hashlib
+import importlib.util
+import platform
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import feedparser
+import numpy as np
 import requests
-from transformers import pipeline
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Silence TensorFlow start-up logging if transformers ever probes for it
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+try:
+    from lxml import etree
+except ImportError:  # Optional: faster RSS parsing
+    etree = None
 
 # Constants
 SENTIMENT_THRESHOLD_POSITIVE = 0.15
 SENTIMENT_THRESHOLD_NEGATIVE = -0.15
 REQUEST_TIMEOUT = 30  # seconds
+CONNECT_TIMEOUT = 10  # seconds
+REQUEST_RETRIES = 3
+HTTP_POOL_SIZE = 8
+MAX_QUOTE_WORKERS = HTTP_POOL_SIZE
 STOCK_DATA_URL = "https://finnhub.io/api/v1/quote"
 GOOGLE_NEWS_RSS_BASE = "https://news.google.com/rss/search"
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(PROJECT_DIR, ".cache")
+HF_CACHE_DIR = os.path.join(CACHE_DIR, "huggingface")
+STOCK_CACHE_TTL = 60  # seconds
+NEWS_CACHE_TTL = 15 * 60  # seconds
+SENTIMENT_CACHE_TTL = 90 * 24 * 60 * 60  # seconds
+SENTIMENT_BATCH_SIZE = 32
+SENTIMENT_MAX_CHARS = 512  # summaries are cut to this length before tokenization
+SENTIMENT_MAX_TOKENS = 256
+QUANTIZED_MODEL_DIR = os.path.join(CACHE_DIR, "sst2-int8")
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+QUANTIZE_FAILED_MARKER = "quantize_failed"
+MODEL_VARIANT_PT = "pt"
+MODEL_VARIANT_INT8 = "int8-onnx"
+SENTIMENT_INDICATORS = {
+    "POSITIVE": "[+] POSITIVE",
+    "NEGATIVE": "[-] NEGATIVE",
+}
+NEUTRAL_INDICATOR = "[ ] NEUTRAL"
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+PLACEHOLDER_PATTERN = re.compile(r'your[_ ]|replace|example|placeholder|xxx|test_', re.IGNORECASE)
+ARTICLE_SUMMARY_WIDTH = 55
+ARTICLE_CARD_BORDER = "+" + "-" * 68 + "+"
+ARTICLE_CARD_TEMPLATE = "\n".join([
+    "",
+    ARTICLE_CARD_BORDER,
+    "|  Article {num}/{total:<58}|",
+    ARTICLE_CARD_BORDER,
+    "|  Title:   {title:<55}|",
+    "|  Date:    {date:<55}|",
+    "|  Sentiment: {indicator:<20} Score: {score:>7.4f}          |",
+    "{summary_block}" + ARTICLE_CARD_BORDER,
+    "",
+])
+PROGRESS_BAR_LENGTH = 30
+PROGRESS_BAR_FULL = "#" * PROGRESS_BAR_LENGTH
+PROGRESS_BAR_EMPTY = "." * PROGRESS_BAR_LENGTH
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session that keeps connections alive and retries transient failures."""
+    session = requests.Session()
+    # Only 5xx responses and a single failed connect are retried; a read timeout is
+    # never retried, so a stalled host cannot multiply the request timeout
+    retry = Retry(
+        total=REQUEST_RETRIES,
+        connect=1,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504)
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by all fetchers so repeat requests reuse open TCP/TLS connections
+HTTP_SESSION = create_http_session()
 
 
 class OutputFormatter:
     """Handles all CLI output formatting for a professional appearance."""
     
+    @staticmethod
+    def _emit(lines: List[str]) -> None:
+        """Write a block of lines to stdout with a single write call."""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     @staticmethod
     def header(title: str, width: int = 70) -> None:
         """Print a formatted header."""
         border = "=" * width
         padding = (width - len(title) - 2) // 2
-        print(f"\n{border}")
-        print(f"{' ' * padding} {title} {' ' * padding}")
-        print(f"{border}\n")
+        OutputFormatter._emit([
+            f"\n{border}",
+            f"{' ' * padding} {title} {' ' * padding}",
+            f"{border}\n",
+        ])
     
     @staticmethod
     def section(title: str, width: int = 70) -> None:
         """Print a section header."""
-        print(f"\n{'-' * width}")
-        print(f"  {title}")
-        print(f"{'-' * width}\n")
+        OutputFormatter._emit([
+            f"\n{'-' * width}",
+            f"  {title}",
+            f"{'-' * width}\n",
+        ])
     
     @staticmethod
     def separator(width: int = 70) -> None:
@@ -67,9 +163,8 @@ class OutputFormatter:
     def progress(current: int, total: int, item: str = "Processing") -> None:
         """Print progress indicator."""
         percentage = int((current / total) * 100)
-        bar_length = 30
-        filled = int(bar_length * current / total)
-        bar = "#" * filled + "." * (bar_length - filled)
+        filled = int(PROGRESS_BAR_LENGTH * current / total)
+        bar = PROGRESS_BAR_FULL[:filled] + PROGRESS_BAR_EMPTY[filled:]
         print(f"\r{item}: [{bar}] {current}/{total} ({percentage}%)", end="", flush=True)
         if current == total:
             print()  # New line when complete
@@ -77,22 +172,25 @@ class OutputFormatter:
     @staticmethod
     def stock_card(ticker: str, data: Dict) -> None:
         """Print stock data in a card format."""
-        current = data.get('c', 0)
-        change = data.get('d', 0)
-        change_pct = data.get('dp', 0)
+        current, prev_close, change, change_pct, high, low, open_price = (
+            data.get(k, 0) for k in ('c', 'pc', 'd', 'dp', 'h', 'l', 'o')
+        )
         change_symbol = "+" if change >= 0 else "-"
         
-        print(f"\n+{'=' * 68}+")
-        print(f"|  Stock Data: {ticker:<53}|")
-        print(f"+{'=' * 68}+")
-        print(f"|  Current Price:        ${current:>10,.2f}                    |")
-        print(f"|  Previous Close:        ${data.get('pc', 0):>10,.2f}                    |")
-        print(f"|  Change:                {change_symbol} ${abs(change):>9,.2f} ({abs(change_pct):>5.2f}%)           |")
-        print(f"+{'-' * 68}+")
-        print(f"|  High (Today):          ${data.get('h', 0):>10,.2f}                    |")
-        print(f"|  Low (Today):           ${data.get('l', 0):>10,.2f}                    |")
-        print(f"|  Open (Today):          ${data.get('o', 0):>10,.2f}                    |")
-        print(f"+{'=' * 68}+\n")
+        lines = [
+            f"\n+{'=' * 68}+",
+            f"|  Stock Data: {ticker:<53}|",
+            f"+{'=' * 68}+",
+            f"|  Current Price:        ${current:>10,.2f}                    |",
+            f"|  Previous Close:        ${prev_close:>10,.2f}                    |",
+            f"|  Change:                {change_symbol} ${abs(change):>9,.2f} ({abs(change_pct):>5.2f}%)           |",
+            f"+{'-' * 68}+",
+            f"|  High (Today):          ${high:>10,.2f}                    |",
+            f"|  Low (Today):           ${low:>10,.2f}                    |",
+            f"|  Open (Today):          ${open_price:>10,.2f}                    |",
+            f"+{'=' * 68}+\n",
+        ]
+        OutputFormatter._emit(lines)
     
     @staticmethod
     def article_card(num: int, total: int, article: Dict, sentiment: Dict) -> None:
@@ -100,13 +198,7 @@ class OutputFormatter:
         label = sentiment['label']
         score = sentiment['normalized_score']
         
-        # Sentiment indicator
-        if label == "POSITIVE":
-            indicator = "[+] POSITIVE"
-        elif label == "NEGATIVE":
-            indicator = "[-] NEGATIVE"
-        else:
-            indicator = "[ ] NEUTRAL"
+        indicator = SENTIMENT_INDICATORS.get(label, NEUTRAL_INDICATOR)
         
         # Format date
         published = article.get('published', 'N/A')
@@ -118,37 +210,37 @@ class OutputFormatter:
         if len(summary) > 150:
             summary = summary[:147] + "..."
         
-        print(f"\n+{'-' * 68}+")
-        print(f"|  Article {num}/{total:<58}|")
-        print(f"+{'-' * 68}+")
         title = article.get('title', 'N/A')
         if len(title) > 55:
             title = title[:52] + "..."
-        print(f"|  Title:   {title:<55}|")
-        print(f"|  Date:    {published:<55}|")
-        print(f"|  Sentiment: {indicator:<20} Score: {score:>7.4f}          |")
+        
+        summary_lines = []
         if summary:
-            print(f"|  Summary:                                               |")
+            summary_lines.append(f"|  Summary:                                               |")
             # Word wrap summary
-            words = summary.split()
-            line = "|          "
-            for word in words:
-                if len(line + word) > 66:
-                    print(f"{line:<70}|")
-                    line = "|          " + word + " "
-                else:
-                    line += word + " "
-            if line.strip() != "|":
-                print(f"{line:<70}|")
-        print(f"+{'-' * 68}+")
+            for line in textwrap.wrap(summary, width=ARTICLE_SUMMARY_WIDTH,
+                                      break_long_words=False, break_on_hyphens=False):
+                summary_lines.append(f"{'|          ' + line:<70}|")
+        summary_block = "".join(f"{line}\n" for line in summary_lines)
+        
+        sys.stdout.write(ARTICLE_CARD_TEMPLATE.format_map({
+            'num': num,
+            'total': total,
+            'title': title,
+            'date': published,
+            'indicator': indicator,
+            'score': score,
+            'summary_block': summary_block,
+        }))
     
     @staticmethod
     def sentiment_summary(total: int, overall_label: str, overall_score: float, 
-                         sentiment_scores: List[float]) -> None:
+                         sentiment_scores: np.ndarray) -> None:
         """Print sentiment analysis summary."""
-        positive_count = sum(1 for s in sentiment_scores if s > 0)
-        negative_count = sum(1 for s in sentiment_scores if s < 0)
-        neutral_count = sum(1 for s in sentiment_scores if s == 0)
+        scores = np.asarray(sentiment_scores, dtype=np.float64)
+        positive_count = int(np.count_nonzero(scores > 0))
+        negative_count = int(np.count_nonzero(scores < 0))
+        neutral_count = scores.size - positive_count - negative_count
         
         # Create visual bars
         max_count = max(positive_count, negative_count, neutral_count, 1)
@@ -161,25 +253,76 @@ class OutputFormatter:
         neg_bar = neg_bar.ljust(20)
         neu_bar = neu_bar.ljust(20)
         
-        print(f"\n+{'=' * 68}+")
-        print(f"|  Sentiment Analysis Summary{' ' * 40}|")
-        print(f"+{'=' * 68}+")
-        print(f"|  Articles Analyzed:     {total:>6}                                    |")
-        print(f"|  Overall Sentiment:      {overall_label:<12} Score: {overall_score:>7.4f}      |")
-        print(f"+{'-' * 68}+")
-        print(f"|  Distribution:                                           |")
-        print(f"|    Positive:  {positive_count:>4}  [{pos_bar}] ({positive_count*100//total:>3}%) |")
-        print(f"|    Negative:  {negative_count:>4}  [{neg_bar}] ({negative_count*100//total:>3}%) |")
-        print(f"|    Neutral:   {neutral_count:>4}  [{neu_bar}] ({neutral_count*100//total:>3}%) |")
-        print(f"+{'=' * 68}+\n")
+        OutputFormatter._emit([
+            f"\n+{'=' * 68}+",
+            f"|  Sentiment Analysis Summary{' ' * 40}|",
+            f"+{'=' * 68}+",
+            f"|  Articles Analyzed:     {total:>6}                                    |",
+            f"|  Overall Sentiment:      {overall_label:<12} Score: {overall_score:>7.4f}      |",
+            f"+{'-' * 68}+",
+            f"|  Distribution:                                           |",
+            f"|    Positive:  {positive_count:>4}  [{pos_bar}] ({positive_count*100//total:>3}%) |",
+            f"|    Negative:  {negative_count:>4}  [{neg_bar}] ({negative_count*100//total:>3}%) |",
+            f"|    Neutral:   {neutral_count:>4}  [{neu_bar}] ({neutral_count*100//total:>3}%) |",
+            f"+{'=' * 68}+\n",
+        ])
+
+
+class FileCache:
+    """Stores JSON-serializable values on disk with a per-lookup time-to-live."""
+    
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a filesystem-safe cache key from one or more strings."""
+        return hashlib.md5("\x1f".join(parts).encode('utf-8')).hexdigest()
+    
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.cache_dir, namespace, f"{key}.json")
+    
+    def get(self, namespace: str, key: str, ttl: float) -> Optional[Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            namespace: Subdirectory grouping related entries
+            key: Entry key within the namespace
+            ttl: Maximum entry age in seconds
+            
+        Returns:
+            The cached value, or None if missing, expired, or unreadable
+        """
+        try:
+            with open(self._path(namespace, key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('ts', 0) >= ttl:
+            return None
+        return entry.get('value')
+    
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value. Write failures are ignored since the cache is best-effort."""
+        path = self._path(namespace, key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'value': value}, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            pass
 
 
 class StockDataFetcher:
     """Handles fetching and processing stock data from Finnhub API."""
     
-    def __init__(self, api_key: str, ticker: str):
+    def __init__(self, api_key: str, ticker: str, cache: Optional[FileCache] = None):
         self.api_key = api_key
         self.ticker = ticker
+        self.cache = cache
         
     def fetch_stock_data(self) -> Optional[Dict]:
         """
@@ -191,29 +334,65 @@ class StockDataFetcher:
         if not self.api_key or not self.ticker:
             OutputFormatter.error("API key or ticker symbol is missing.")
             return None
+        return self.fetch_quotes([self.ticker])[self.ticker]
+    
+    def fetch_quotes(self, symbols: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch real-time stock data for several symbols concurrently.
+        
+        Finnhub's quote endpoint takes one symbol per request, so requests are
+        issued in parallel (up to MAX_QUOTE_WORKERS at a time) over the shared
+        HTTP session.
+        
+        Args:
+            symbols: Ticker symbols to fetch
+            
+        Returns:
+            Dictionary mapping each symbol to its stock data, or None if its fetch failed
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not self.api_key:
+            OutputFormatter.error("API key is missing.")
+            return {symbol: None for symbol in symbols}
+        if len(symbols) <= 1:
+            return {symbol: self._fetch_quote(symbol) for symbol in symbols}
+        
+        with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_QUOTE_WORKERS)) as executor:
+            return dict(zip(symbols, executor.map(self._fetch_quote, symbols)))
+    
+    def _fetch_quote(self, symbol: str) -> Optional[Dict]:
+        """Fetch (or read from cache) the quote for a single symbol."""
+        if self.cache:
+            cached = self.cache.get('stock', FileCache.make_key(symbol), STOCK_CACHE_TTL)
+            if cached is not None:
+                OutputFormatter.info(f"Using cached quote for {symbol} (up to {STOCK_CACHE_TTL}s old)")
+                return cached
             
         try:
-            url = f"{STOCK_DATA_URL}?symbol={self.ticker}&token={self.api_key}"
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            url = f"{STOCK_DATA_URL}?symbol={symbol}&token={self.api_key}"
+            response = HTTP_SESSION.get(url, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT))
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             # Validate response structure
             if 'c' not in data:
-                OutputFormatter.error(f"Invalid stock data response for {self.ticker}")
+                OutputFormatter.error(f"Invalid stock data response for {symbol}")
                 return None
+            
+            if self.cache:
+                self.cache.set('stock', FileCache.make_key(symbol), data)
                 
             return data
             
         except requests.exceptions.Timeout:
-            OutputFormatter.error(f"Request timeout while fetching stock data for {self.ticker}")
+            OutputFormatter.error(f"Request timeout while fetching stock data for {symbol}")
             return None
         except requests.exceptions.RequestException as e:
-            OutputFormatter.error(f"Error fetching stock data: {e}")
+            OutputFormatter.error(f"Error fetching stock data for {symbol}: {e}")
             return None
         except json.JSONDecodeError:
-            OutputFormatter.error("Invalid JSON response from stock API")
+            OutputFormatter.error(f"Invalid JSON response from stock API for {symbol}")
             return None
     
     def format_stock_data(self, data: Dict) -> None:
@@ -227,78 +406,298 @@ class StockDataFetcher:
 class NewsAnalyzer:
     """Handles fetching news articles and performing sentiment analysis."""
     
-    def __init__(self, keyword: str):
+    def __init__(self, keyword: str, cache: Optional[FileCache] = None):
         self.keyword = keyword
+        self.cache = cache
         self.sentiment_pipeline = None
+        # Backend serving the model (MODEL_VARIANT_PT or MODEL_VARIANT_INT8); part of
+        # the sentiment cache key so scores from one backend are never reused by the other
+        self.model_variant: Optional[str] = None
+        self.last_error: Optional[str] = None
+        
+    @staticmethod
+    def _quantization_config():
+        """
+        Pick a dynamic int8 quantization config for the CPU doing the export.
+        
+        Only AVX-512 VNNI runs u8s8 int8 matmuls without risk of saturation, so other
+        x86 CPUs quantize weights with reduce_range (7-bit) to keep accuracy; ARM
+        gets its own config.
+        """
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        if platform.machine().lower() in ('arm64', 'aarch64'):
+            return AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+        
+        flags = set()
+        try:
+            with open('/proc/cpuinfo') as f:
+                for line in f:
+                    if line.startswith('flags'):
+                        flags = set(line.split(':', 1)[1].split())
+                        break
+        except OSError:
+            pass  # No cpuinfo (macOS, Windows): assume the conservative AVX2 config
+        
+        if 'avx512_vnni' in flags:
+            return AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        if 'avx512f' in flags:
+            return AutoQuantizationConfig.avx512(is_static=False, per_channel=False, reduce_range=True)
+        return AutoQuantizationConfig.avx2(is_static=False, per_channel=False, reduce_range=True)
+    
+    @staticmethod
+    def _load_quantized_model():
+        """
+        Load an int8 ONNX Runtime copy of the sentiment model.
+        
+        The model is exported and dynamically quantized on first use, then reused
+        from QUANTIZED_MODEL_DIR on later runs. A failed attempt leaves a marker
+        file there so later runs skip straight to PyTorch; delete the directory
+        to try again.
         
+        Returns:
+            ORTModelForSequenceClassification, or None if optimum is not installed,
+            the export fails or an earlier attempt failed
+        """
+        failed_marker = os.path.join(QUANTIZED_MODEL_DIR, QUANTIZE_FAILED_MARKER)
+        if os.path.isfile(failed_marker):
+            return None
+        
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        except ImportError:
+            return None
+        
+        try:
+            if not os.path.isfile(os.path.join(QUANTIZED_MODEL_DIR, QUANTIZED_MODEL_FILE)):
+                OutputFormatter.info("Quantizing sentiment model to int8 (first run only)...")
+                onnx_model = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True)
+                quantizer = ORTQuantizer.from_pretrained(onnx_model)
+                quantizer.quantize(
+                    save_dir=QUANTIZED_MODEL_DIR,
+                    quantization_config=NewsAnalyzer._quantization_config()
+                )
+            return ORTModelForSequenceClassification.from_pretrained(
+                QUANTIZED_MODEL_DIR,
+                file_name=QUANTIZED_MODEL_FILE,
+                provider="CPUExecutionProvider"
+            )
+        except Exception as e:
+            OutputFormatter.error(f"Quantized model unavailable, falling back to PyTorch: {e}")
+            try:
+                os.makedirs(QUANTIZED_MODEL_DIR, exist_ok=True)
+                with open(failed_marker, 'w') as f:
+                    f.write(f"{e}\n")
+            except OSError:
+                pass
+            return None
+    
+    @staticmethod
+    def _load_pretrained(loader: Callable, *args, **kwargs):
+        """Load from the local model cache, only contacting the Hugging Face Hub on a cache miss."""
+        try:
+            return loader(*args, local_files_only=True, **kwargs)
+        except OSError:
+            return loader(*args, **kwargs)
+    
+    @staticmethod
+    def _configure_torch_threads() -> None:
+        """Use roughly one intra-op thread per physical core and no inter-op fan-out."""
+        import torch
+        
+        torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once, before any inter-op parallel work has started
+            pass
+    
     def initialize_sentiment_model(self):
         """Initialize the sentiment analysis pipeline (lazy loading)."""
         if self.sentiment_pipeline is None:
             OutputFormatter.info("Loading AI sentiment analysis model...")
             try:
-                self.sentiment_pipeline = pipeline('sentiment-analysis')
+                # Imported here so runs that never reach inference skip the torch start-up cost
+                import torch
+                from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+                
+                self._configure_torch_threads()
+                tokenizer = self._load_pretrained(
+                    AutoTokenizer.from_pretrained,
+                    SENTIMENT_MODEL, use_fast=True, clean_up_tokenization_spaces=True
+                )
+                device = 0 if torch.cuda.is_available() else -1
+                # int8 ONNX Runtime is only worthwhile on CPU; GPUs keep the PyTorch model
+                model = self._load_quantized_model() if device == -1 else None
+                if model is None:
+                    model = self._load_pretrained(
+                        AutoModelForSequenceClassification.from_pretrained, SENTIMENT_MODEL
+                    )
+                    self.model_variant = MODEL_VARIANT_PT
+                else:
+                    self.model_variant = MODEL_VARIANT_INT8
+                self.sentiment_pipeline = pipeline(
+                    'sentiment-analysis',
+                    model=model,
+                    tokenizer=tokenizer,
+                    framework='pt',
+                    device=device
+                )
+                # Warm-up pass so lazy kernel/allocator setup happens before real inputs
+                self.sentiment_pipeline("warm up")
                 OutputFormatter.success("Model loaded successfully")
             except Exception as e:
                 OutputFormatter.error(f"Error loading sentiment model: {e}")
                 sys.exit(1)
     
+    def _expected_model_variant(self) -> str:
+        """
+        Return the backend the model runs (or will run) on, without loading it.
+        
+        Before the model is loaded this predicts the choice initialize_sentiment_model
+        makes without importing torch: int8 ONNX Runtime when a quantized model from
+        an earlier run is on disk and optimum and onnxruntime are both installed,
+        PyTorch otherwise. A wrong guess only costs a second round of cache lookups
+        once the model has loaded.
+        """
+        if self.model_variant is None:
+            quantized_ready = (
+                os.path.isfile(os.path.join(QUANTIZED_MODEL_DIR, QUANTIZED_MODEL_FILE))
+                and importlib.util.find_spec("optimum") is not None
+                and importlib.util.find_spec("onnxruntime") is not None
+            )
+            self.model_variant = MODEL_VARIANT_INT8 if quantized_ready else MODEL_VARIANT_PT
+        return self.model_variant
+    
+    def _sentiment_cache_key(self, text: str) -> str:
+        """Build the cache key for a text's sentiment under the current model and backend."""
+        return FileCache.make_key(SENTIMENT_MODEL, self._expected_model_variant(), text)
+    
     def clean_html(self, text: str) -> str:
         """Remove HTML tags and decode HTML entities from text."""
         if not text:
             return ''
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        # Decode common HTML entities
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        text = text.replace('&nbsp;', ' ')
-        # Clean up extra whitespace
-        text = ' '.join(text.split())
-        return text
-    
-    def fetch_news_articles(self) -> List[Dict]:
+        # Strip tags before decoding so escaped markup in the text survives,
+        # then collapse extra whitespace
+        return ' '.join(html.unescape(HTML_TAG_PATTERN.sub('', text)).split())
+    
+    def fetch_news_articles(self, report_errors: bool = True) -> List[Dict]:
         """
         Fetch news articles from Google News RSS feed.
         
+        Args:
+            report_errors: Print errors as they happen. Pass False when fetching on a
+                background thread; the message is kept in last_error for the caller
+                to print at the right point in the output
+        
         Returns:
             List of article dictionaries
         """
+        self.last_error = None
         if not self.keyword:
-            print("Error: Keyword is missing.")
-            return []
+            return self._news_error("Keyword is missing.", report_errors)
+        
+        news_key = None
+        if self.cache:
+            # Bucket news by day so a stale feed is never served across dates
+            news_key = FileCache.make_key(self.keyword, datetime.now().strftime("%Y-%m-%d"))
+            cached = self.cache.get('news', news_key, NEWS_CACHE_TTL)
+            if cached is not None:
+                return cached
             
         try:
             url = f"{GOOGLE_NEWS_RSS_BASE}?q={self.keyword}&hl=en-US&gl=US&ceid=US:en"
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response = HTTP_SESSION.get(url, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT))
             response.raise_for_status()
             
-            feed = feedparser.parse(response.text)
+            articles = self._parse_rss_items(response.content)
+            if articles is None:
+                articles = self._parse_feed_entries(response.text)
             
-            articles = []
-            for entry in feed.entries:
-                # Clean HTML from summary
-                summary = self.clean_html(entry.get('summary', ''))
-                articles.append({
-                    'title': self.clean_html(entry.get('title', 'No title')),
-                    'link': entry.get('link', ''),
-                    'published': entry.get('published', ''),
-                    'summary': summary
-                })
+            if self.cache and articles:
+                self.cache.set('news', news_key, articles)
                 
             return articles
             
         except requests.exceptions.Timeout:
-            OutputFormatter.error("Request timeout while fetching news articles")
-            return []
+            return self._news_error("Request timeout while fetching news articles", report_errors)
         except requests.exceptions.RequestException as e:
-            OutputFormatter.error(f"Error fetching news articles: {e}")
-            return []
+            return self._news_error(f"Error fetching news articles: {e}", report_errors)
         except Exception as e:
-            OutputFormatter.error(f"Error parsing RSS feed: {e}")
-            return []
+            return self._news_error(f"Error parsing RSS feed: {e}", report_errors)
+    
+    def _news_error(self, message: str, report_errors: bool) -> List[Dict]:
+        """Record a news fetch error, print it if requested, and return no articles."""
+        self.last_error = message
+        if report_errors:
+            OutputFormatter.error(message)
+        return []
+    
+    def _parse_rss_items(self, content: bytes) -> Optional[List[Dict]]:
+        """
+        Parse a plain RSS 2.0 document with lxml.
+        
+        Args:
+            content: Raw feed bytes
+            
+        Returns:
+            List of article dictionaries, or None if lxml is unavailable or the
+            document is not well-formed RSS (callers then fall back to feedparser)
+        """
+        if etree is None:
+            return None
+        try:
+            parser = etree.XMLParser(resolve_entities=False, no_network=True)
+            root = etree.fromstring(content, parser)
+        except etree.XMLSyntaxError:
+            return None
+        channel = root.find('channel')
+        if channel is None:
+            return None
+        
+        return [
+            {
+                'title': self.clean_html(item.findtext('title', 'No title')),
+                'link': item.findtext('link', ''),
+                'published': item.findtext('pubDate', ''),
+                'summary': self.clean_html(item.findtext('description', ''))
+            }
+            for item in channel.iterfind('item')
+        ]
+    
+    def _parse_feed_entries(self, text: str) -> List[Dict]:
+        """Parse any feed format feedparser understands into article dictionaries."""
+        feed = feedparser.parse(text)
+        
+        articles = []
+        for entry in feed.entries:
+            # Clean HTML from summary
+            summary = self.clean_html(entry.get('summary', ''))
+            articles.append({
+                'title': self.clean_html(entry.get('title', 'No title')),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', ''),
+                'summary': summary
+            })
+        return articles
+    
+    @staticmethod
+    def _normalize_result(result: Dict) -> Dict:
+        """Convert a raw pipeline result into a signed sentiment dictionary."""
+        label = result['label']
+        score = result['score']
+        
+        # Convert NEGATIVE to negative score
+        if label == "NEGATIVE":
+            normalized_score = -score
+        else:
+            normalized_score = score
+        
+        return {
+            'label': label,
+            'score': score,
+            'normalized_score': normalized_score
+        }
     
     def analyze_sentiment(self, text: str) -> Optional[Dict]:
         """
@@ -310,32 +709,108 @@ class NewsAnalyzer:
         Returns:
             Dictionary with label and score, or None if analysis fails
         """
-        if not text or not text.strip():
-            return {'label': 'NEUTRAL', 'score': 0.0, 'normalized_score': 0.0}
-            
-        try:
-            self.initialize_sentiment_model()
-            result = self.sentiment_pipeline(text)[0]
+        return self.analyze_sentiments_batch([text])[0]
+    
+    def _resolve_without_model(self, texts: List[str]
+                               ) -> Tuple[List[Optional[Dict]], Dict[str, List[int]]]:
+        """
+        Score empty texts as neutral and fill in cached results.
+        
+        Returns:
+            Tuple of (results aligned with texts, unique texts still needing the
+            model mapped to every index they appear at)
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        
+        for i, text in enumerate(texts):
+            text = text[:SENTIMENT_MAX_CHARS] if text else text
+            if not text or not text.strip():
+                results[i] = {'label': 'NEUTRAL', 'score': 0.0, 'normalized_score': 0.0}
+            elif text in pending:
+                pending[text].append(i)
+            else:
+                cached = None
+                if self.cache:
+                    cached = self.cache.get('sentiment', self._sentiment_cache_key(text), SENTIMENT_CACHE_TTL)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending[text] = [i]
+        
+        return results, pending
+    
+    def analyze_sentiments_batch(self, texts: List[str],
+                                 progress_callback: Optional[Callable[[int, int], None]] = None
+                                 ) -> List[Optional[Dict]]:
+        """
+        Analyze sentiment of several text strings using batched model inference.
+        
+        Texts are cut to SENTIMENT_MAX_CHARS first. Empty texts are scored as
+        neutral, duplicate texts are analyzed once and cached results are reused,
+        so only the remaining unique texts are sent through the model,
+        SENTIMENT_BATCH_SIZE at a time.
+        
+        Args:
+            texts: Texts to analyze
+            progress_callback: Optional callable receiving (completed, total) after
+                cached results are resolved and after each model batch
             
-            # Normalize sentiment score
-            label = result['label']
-            score = result['score']
+        Returns:
+            List of sentiment dictionaries aligned with texts; entries are None
+            where analysis failed
+        """
+        total = len(texts)
+        results, pending = self._resolve_without_model(texts)
+        if not pending:
+            if progress_callback and total:
+                progress_callback(total, total)
+            return results
+        
+        # Load the model before drawing any progress so its status messages
+        # do not land on the same line as the progress bar
+        lookup_variant = self.model_variant
+        self.initialize_sentiment_model()
+        if self.cache and self.model_variant != lookup_variant:
+            # The backend that actually loaded differs from the one predicted for the
+            # cache lookups, so redo them under the right key
+            results, pending = self._resolve_without_model(texts)
+        
+        completed = total - sum(len(indices) for indices in pending.values())
+        unique_texts = list(pending)
+        progress_drawn = bool(progress_callback and completed)
+        if progress_drawn:
+            progress_callback(completed, total)
+        
+        for start in range(0, len(unique_texts), SENTIMENT_BATCH_SIZE):
+            batch = unique_texts[start:start + SENTIMENT_BATCH_SIZE]
+            # A failing batch only loses its own articles; later batches still run
+            try:
+                outputs = self.sentiment_pipeline(
+                    batch,
+                    batch_size=SENTIMENT_BATCH_SIZE,
+                    truncation=True,
+                    max_length=SENTIMENT_MAX_TOKENS,
+                    padding='longest'
+                )
+                for text, output in zip(batch, outputs):
+                    sentiment = self._normalize_result(output)
+                    for i in pending[text]:
+                        results[i] = sentiment
+                    if self.cache:
+                        self.cache.set('sentiment', self._sentiment_cache_key(text), sentiment)
+            except Exception as e:
+                if progress_drawn and completed < total:
+                    print()  # Finish the partial progress line before reporting
+                OutputFormatter.error(f"Error analyzing sentiment: {e}")
             
-            # Convert NEGATIVE to negative score
-            if label == "NEGATIVE":
-                normalized_score = -score
-            else:
-                normalized_score = score
-                
-            return {
-                'label': label,
-                'score': score,
-                'normalized_score': normalized_score
-            }
+            # Failed texts count as processed so the progress bar still completes
+            completed += sum(len(pending[text]) for text in batch)
+            if progress_callback:
+                progress_callback(completed, total)
+                progress_drawn = True
             
-        except Exception as e:
-            OutputFormatter.error(f"Error analyzing sentiment: {e}")
-            return None
+        return results
 
 
 class SentimentAggregator:
@@ -346,20 +821,22 @@ class SentimentAggregator:
         self.positive_threshold = positive_threshold
         self.negative_threshold = negative_threshold
         
-    def calculate_overall_sentiment(self, sentiment_scores: List[float]) -> Tuple[str, float]:
+    def calculate_overall_sentiment(self, sentiment_scores: np.ndarray) -> Tuple[str, float]:
         """
-        Calculate overall sentiment from a list of sentiment scores.
+        Calculate overall sentiment from an array of sentiment scores.
         
         Args:
-            sentiment_scores: List of normalized sentiment scores
+            sentiment_scores: Array (or sequence) of normalized sentiment scores
             
         Returns:
             Tuple of (sentiment_label, average_score)
         """
-        if not sentiment_scores:
+        # float64 keeps the average consistent with the per-article scores in the export
+        scores = np.asarray(sentiment_scores, dtype=np.float64)
+        if scores.size == 0:
             return ("NEUTRAL", 0.0)
             
-        average_score = sum(sentiment_scores) / len(sentiment_scores)
+        average_score = float(scores.mean())
         
         if average_score >= self.positive_threshold:
             label = "POSITIVE"
@@ -389,12 +866,11 @@ def validate_environment() -> Tuple[str, str, str]:
     
     # Check for missing or placeholder values
     missing = []
-    placeholder_patterns = ['your_', 'your ', 'replace', 'example', 'placeholder', 'xxx', 'test_']
     
     # Validate API_KEY
     if not api_key:
         missing.append('API_KEY')
-    elif any(pattern in api_key.lower() for pattern in placeholder_patterns):
+    elif PLACEHOLDER_PATTERN.search(api_key):
         missing.append('API_KEY')
         print(f"Debug: API_KEY appears to be a placeholder: '{api_key[:20]}...'")
     
@@ -441,8 +917,17 @@ def save_results_to_json(results: Dict, filename: str = None):
         filename = f"sentiment_analysis_{timestamp}.json"
         
     try:
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if orjson is not None:
+            payload = orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str
+            )
+            with open(filename, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
         OutputFormatter.success(f"Results saved to: {filename}")
     except Exception as e:
         OutputFormatter.error(f"Error saving results: {e}")
@@ -458,24 +943,34 @@ def main():
     except SystemExit:
         return
     
-    # Initialize components
-    stock_fetcher = StockDataFetcher(api_key, ticker)
-    news_analyzer = NewsAnalyzer(keyword)
+    # Initialize components (USE_CACHE=false disables the on-disk cache)
+    use_cache = os.getenv('USE_CACHE', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+    cache = FileCache() if use_cache else None
+    stock_fetcher = StockDataFetcher(api_key, ticker, cache)
+    news_analyzer = NewsAnalyzer(keyword, cache)
     sentiment_aggregator = SentimentAggregator()
     
-    # Fetch stock data
-    OutputFormatter.section("Stock Data")
-    OutputFormatter.info(f"Fetching real-time data for {ticker}...")
-    stock_data = stock_fetcher.fetch_stock_data()
-    if stock_data:
-        stock_fetcher.format_stock_data(stock_data)
-    else:
-        OutputFormatter.error("Stock data unavailable. Continuing with news analysis...")
-    
-    # Fetch news articles
-    OutputFormatter.section("News Articles")
-    OutputFormatter.info(f"Searching for articles about '{keyword}'...")
-    articles = news_analyzer.fetch_news_articles()
+    # The quote and the news feed come from different hosts, so download the feed in the
+    # background while the stock section runs. Its errors are held back and printed under
+    # the News Articles section so output order does not depend on thread timing.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        news_future = executor.submit(news_analyzer.fetch_news_articles, report_errors=False)
+        
+        # Fetch stock data
+        OutputFormatter.section("Stock Data")
+        OutputFormatter.info(f"Fetching real-time data for {ticker}...")
+        stock_data = stock_fetcher.fetch_stock_data()
+        if stock_data:
+            stock_fetcher.format_stock_data(stock_data)
+        else:
+            OutputFormatter.error("Stock data unavailable. Continuing with news analysis...")
+        
+        # Fetch news articles
+        OutputFormatter.section("News Articles")
+        OutputFormatter.info(f"Searching for articles about '{keyword}'...")
+        articles = news_future.result()
+        if news_analyzer.last_error:
+            OutputFormatter.error(news_analyzer.last_error)
     
     if not articles:
         OutputFormatter.error("No articles found. Exiting.")
@@ -487,17 +982,19 @@ def main():
     OutputFormatter.section("Sentiment Analysis")
     OutputFormatter.info("Analyzing article sentiment using AI model...")
     
-    sentiment_scores = []
     analysis_results = []
+    # Keep each article next to its own result so a failed batch cannot shift the cards
+    analyzed_articles = []
     
-    # Show compact progress for each article
-    for i, article in enumerate(articles, 1):
-        OutputFormatter.progress(i, len(articles), "Analyzing articles")
-        
-        sentiment = news_analyzer.analyze_sentiment(article['summary'])
-        
+    # Run all summaries through the model in batches, showing compact progress
+    sentiments = news_analyzer.analyze_sentiments_batch(
+        [article['summary'] for article in articles],
+        progress_callback=lambda done, total: OutputFormatter.progress(done, total, "Analyzing articles")
+    )
+    
+    for article, sentiment in zip(articles, sentiments):
         if sentiment:
-            sentiment_scores.append(sentiment['normalized_score'])
+            analyzed_articles.append((article, sentiment))
             analysis_results.append({
                 'title': article['title'],
                 'link': article['link'],
@@ -509,25 +1006,25 @@ def main():
     print()  # Blank line after progress
     
     # Show detailed article cards (first 10 only to avoid clutter)
-    max_display = min(10, len(articles))
+    max_display = min(10, len(analyzed_articles))
     OutputFormatter.info(f"Displaying detailed analysis for first {max_display} articles:")
     
-    for i in range(max_display):
-        if i < len(analysis_results):
-            article = articles[i]
-            sentiment = {
-                'label': analysis_results[i]['sentiment_label'],
-                'normalized_score': analysis_results[i]['sentiment_score']
-            }
-            print_article_analysis(article, sentiment, i + 1, len(articles))
+    for i, (article, sentiment) in enumerate(analyzed_articles[:max_display]):
+        print_article_analysis(article, sentiment, i + 1, len(analyzed_articles))
     
-    if len(articles) > max_display:
-        OutputFormatter.info(f"... and {len(articles) - max_display} more articles (see JSON export for full details)")
+    if len(analyzed_articles) > max_display:
+        OutputFormatter.info(f"... and {len(analyzed_articles) - max_display} more articles (see JSON export for full details)")
     
     # Calculate overall sentiment
     OutputFormatter.section("Analysis Summary")
     
-    if sentiment_scores:
+    sentiment_scores = np.fromiter(
+        (result['sentiment_score'] for result in analysis_results),
+        dtype=np.float64,
+        count=len(analysis_results)
+    )
+    
+    if sentiment_scores.size:
         overall_label, overall_score = sentiment_aggregator.calculate_overall_sentiment(sentiment_scores)
         OutputFormatter.sentiment_summary(len(sentiment_scores), overall_label, overall_score, sentiment_scores)
         
@@ -556,6 +1053,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Keep downloaded models in the project cache when run as a script (must be set before
+    # transformers is imported, which happens lazily in NewsAnalyzer.initialize_sentiment_model)
+    os.environ.setdefault('HF_HOME', HF_CACHE_DIR)
     try:
         main()
     except KeyboardInterrupt: